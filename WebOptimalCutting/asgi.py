@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "WebOptimalCutting.settings")
 
 application = get_asgi_application()
+
+# Rozgrzewamy matplotlib tylko w procesie serwującym (nie przy komendach manage.py)
+from cutting.plot.draw_cuttings_v2 import warm_up_draw_cuttings  # noqa: E402
+
+warm_up_draw_cuttings()
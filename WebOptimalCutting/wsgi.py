@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "WebOptimalCutting.settings")
 
 application = get_wsgi_application()
+
+# Rozgrzewamy matplotlib tylko w procesie serwującym (nie przy komendach manage.py)
+from cutting.plot.draw_cuttings_v2 import warm_up_draw_cuttings  # noqa: E402
+
+warm_up_draw_cuttings()
@@ -1,34 +1,60 @@
+import re
+
 from django import forms
 
+# Bytes allowed in a parts file: ASCII digits and whitespace
+PARTS_FILE_ALLOWED_BYTES = b'0123456789 \t\n\r\f\v'
+
+# First whitespace-separated token that is not made of ASCII digits only
+INVALID_NUMBER_RE = re.compile(rb'\S*[^0-9\s]\S*')
+
+# Upper bound for rows in the manual parts table
+MAX_PARTS_ROWS = 1000
+
+
+class PartForm(forms.Form):
+    length = forms.IntegerField(label='Length')
+    quantity = forms.IntegerField(label='Quantity')
+
+
+PartFormSet = forms.formset_factory(PartForm, extra=1, absolute_max=MAX_PARTS_ROWS)
+
 
 class ManualCuttingForm(forms.Form):
     raw_length = forms.IntegerField(label='Długość surowca')
-    parts_length = forms.CharField(widget=forms.HiddenInput(), required=False)
-    parts_quantity = forms.CharField(widget=forms.HiddenInput(), required=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Rows of the parts table are posted as parts-<n>-length / parts-<n>-quantity
+        self.parts_formset = PartFormSet(self.data if self.is_bound else None, prefix='parts')
 
     # run if we call .cleaned_data or is_valid()
     def clean(self):
         cleaned_data = super().clean()
-        parts_length = self.data.getlist('parts_length[]')
-        parts_quantity = self.data.getlist('parts_quantity[]')
 
-        # Ensure that the lengths and quantities are properly paired
-        if len(parts_length) != len(parts_quantity):
-            raise forms.ValidationError("Lengths and quantities must have the same number of elements.")
+        parts_formset = self.parts_formset
 
-        # Check that all lengths and quantities are provided
-        if not parts_length or not parts_quantity:
+        # Check row count from the management form, before any row form is built
+        # (missing management data counts as zero rows)
+        total_forms = parts_formset.management_form.cleaned_data.get('TOTAL_FORMS', 0)
+        if not total_forms:
             raise forms.ValidationError("Both parts_length and parts_quantity are required.")
+        if total_forms > MAX_PARTS_ROWS:
+            raise forms.ValidationError(f"At most {MAX_PARTS_ROWS} parts can be submitted.")
 
-        # Check that all lengths and quantities are valid integers
-        try:
-            parts_length = [int(length) for length in parts_length]
-            parts_quantity = [int(quantity) for quantity in parts_quantity]
-        except ValueError:
+        # IntegerField already coerces every value, so only row-level errors are left to report
+        if not parts_formset.is_valid():
             raise forms.ValidationError("All parts_length and parts_quantity must be valid integers.")
 
-        cleaned_data['parts_length'] = parts_length
-        cleaned_data['parts_quantity'] = parts_quantity
+        # Skip rows left completely empty in the table
+        parts = [part_form.cleaned_data for part_form in parts_formset if part_form.cleaned_data]
+
+        # Check that at least one part is provided
+        if not parts:
+            raise forms.ValidationError("Both parts_length and parts_quantity are required.")
+
+        cleaned_data['parts_length'] = [part['length'] for part in parts]
+        cleaned_data['parts_quantity'] = [part['quantity'] for part in parts]
         return cleaned_data
 
 
@@ -40,27 +66,31 @@ class FileCuttingForm(forms.Form):
 
         if file:
             # Odczytujemy zawartość pliku
+            # Plik zawiera tylko cyfry ASCII i białe znaki, więc nie dekodujemy go
             try:
-                content = file.read().decode('utf-8')
-                numbers = content.split()
-
-                # Sprawdzamy, czy wszystkie elementy są liczbami
-                for number in numbers:
-                    if not number.isdigit():
-                        raise forms.ValidationError(f"Invalid number found: {number}")
+                content = file.read()
+            except OSError as e:
+                raise forms.ValidationError(f"Error processing file: {e}")
 
-                # Zamieniamy listę na liczby całkowite
-                numbers = [int(number) for number in numbers]
+            # Sprawdzamy, czy wszystkie elementy są liczbami (usuwamy dozwolone bajty, nic nie powinno zostać)
+            if content.translate(None, PARTS_FILE_ALLOWED_BYTES):
+                # Wyszukujemy błędny element tylko na potrzeby komunikatu
+                invalid_token = INVALID_NUMBER_RE.search(content).group().decode('utf-8', errors='replace')
+                raise forms.ValidationError(f"Invalid number found: {invalid_token}")
 
-                # Dodatkowe sprawdzenia, jeśli są potrzebne
-                # Na przykład, sprawdzenie długości listy itp.
-                if len(numbers) < 2:
-                    raise forms.ValidationError("The file must contain at least two numbers.")
+            numbers = content.split()
 
-                # Zwrot sprawdzonych danych jako atrybut 'parts_list'
-                self.cleaned_data['parts_list'] = numbers
+            # Sprawdzenie długości listy przed konwersją
+            if len(numbers) < 2:
+                raise forms.ValidationError("The file must contain at least two numbers.")
 
-            except Exception as e:
+            # Zamieniamy listę na liczby całkowite (int() odrzuca np. liczby dłuższe niż limit cyfr interpretera)
+            try:
+                numbers = list(map(int, numbers))
+            except ValueError as e:
                 raise forms.ValidationError(f"Error processing file: {e}")
 
+            # Zwrot sprawdzonych danych jako atrybut 'parts_list'
+            self.cleaned_data['parts_list'] = numbers
+
         return file
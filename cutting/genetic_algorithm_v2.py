@@ -1,6 +1,8 @@
 import random
 import uuid
 from collections import Counter
+from itertools import chain, count
+from operator import itemgetter, mul
 
 from cutting.plot.draw_cuttings_v2 import draw_cuttings_v2
 
@@ -31,6 +33,7 @@ class GeneticAlgorithm:
                  generation_count=100,
                  next_generation_feasible_patterns_percent=0.8,
                  mutation_probability=0.2,
+                 patience=15,
                  ):
 
         self.beam_length = beam_length
@@ -40,17 +43,39 @@ class GeneticAlgorithm:
         self.generation_count = generation_count
         self.next_generation_feasible_patterns_percent = next_generation_feasible_patterns_percent
         self.mutation_probability = mutation_probability
+        # Stop early after this many generations without a better solution (None disables early stopping)
+        self.patience = patience
         self.unique_element_lengths = [int(el) for el in Counter(self.element_lengths).keys()]
         self.unique_element_lengths_and_count_dict = dict(Counter(self.element_lengths))
+        # Initial demand aligned with unique element lengths and total length of all elements (both immutable)
+        self.initial_remaining_elements = [self.unique_element_lengths_and_count_dict[length]
+                                           for length in self.unique_element_lengths]
+        self.all_elements_length = sum(self.element_lengths)
+        # Lower bound of the waste: every element cut from the minimal number of beams, ceil(total / beam_length)
+        self.minimum_waste = -self.all_elements_length % self.beam_length
         self.feasible_cut_patterns = []
         self.best_cut_patterns = []
+        # Lookup indexes over best_cut_patterns and feasible_cut_patterns (see __index_cut_patterns)
+        self.cut_patterns_by_id = {}
+        self.feasible_cut_patterns_by_pattern = {}
+        self.best_cut_patterns_by_pattern = {}
+        # Genotype waste by genotype tuple, valid until the ID index is rebuilt
+        self.genotype_waste_cache = {}
+        # Cut pattern IDs are a random per-run prefix plus a counter (32 hex characters, like uuid4().hex)
+        self.cut_pattern_id_prefix = uuid.uuid4().hex[:24]
+        self.cut_pattern_id_counter = count()
         self.solution_population_1 = []
         self.solution_population_2 = []
         self.solution_population = []
         self.solution_cut_patterns = []
         self.crossed_cut_patterns = []
+        # Patterns already added to solution_cut_patterns / seen as crossover children, kept across generations
+        self.solution_cut_patterns_seen = set()
+        self.crossed_cut_patterns_seen = set()
         self.elite_cut_patterns = []
         self.elite_solution = []
+        self.best_solution_waste = None
+        self.generations_without_improvement = 0
 
     @staticmethod
     def calculate_fitness(cut_pattern):
@@ -66,17 +91,18 @@ class GeneticAlgorithm:
 
         return 1.0 / (cut_pattern["waste"] + 1e-10)
 
-    @staticmethod
-    def __generate_unique_id():
-        return uuid.uuid4().hex
+    def __generate_unique_id(self):
+        return f'{self.cut_pattern_id_prefix}{next(self.cut_pattern_id_counter):08x}'
 
     @staticmethod
     def __subtract_elements(remaining_elements, values_list, frequency):
         """
-        Subtract frequencies of elements from the remaining_elements dictionary.
+        Subtract frequencies of elements from the remaining_elements list in place.
+
+        The list is only modified when no element would drop below 0.
 
-        :param remaining_elements: Dictionary representing remaining quantities of elements.
-        :type remaining_elements: dict
+        :param remaining_elements: Remaining quantities of elements, aligned with the unique element lengths.
+        :type remaining_elements: list
 
         :param values_list: List of values used for subtraction.
         :type values_list: list
@@ -84,67 +110,18 @@ class GeneticAlgorithm:
         :param frequency: Number of times to subtract the values from remaining_elements.
         :type frequency: int
 
-        :return: Updated dictionary after subtraction if successful, False otherwise.
-        :rtype: dict or bool
+        :return: Updated list after subtraction if successful, False otherwise.
+        :rtype: list or bool
         """
-        modified_remaining_elements = remaining_elements.copy()
-
-        for key, value in zip(modified_remaining_elements.keys(), values_list):
-            modified_remaining_elements[key] -= value * frequency
-
-            # Check if the value after subtraction is less than 0
-            if modified_remaining_elements[key] < 0:
-                # Restore the previous value
-                modified_remaining_elements[key] += value
+        # Check if any value after subtraction would be less than 0
+        for remaining, value in zip(remaining_elements, values_list):
+            if remaining < value * frequency:
                 return False
 
-        return modified_remaining_elements
-
-    @staticmethod
-    def __is_cut_pattern_unique_in_cut_patterns(cut_pattern, cut_patterns):
-        """
-        Check if a cutting pattern is unique among a given list of cutting patterns.
+        for i, value in enumerate(values_list):
+            remaining_elements[i] -= value * frequency
 
-        The method compares the pattern of the specified cutting pattern with the patterns of existing cutting patterns.
-        If the pattern is not present among the seen patterns, it is considered unique.
-
-        :param cut_pattern: Cutting pattern to check for uniqueness.
-        :type cut_pattern: dict
-
-        :param cut_patterns: List of existing cutting patterns.
-        :type cut_patterns: list
-
-        :return: True if the cutting pattern is unique, False otherwise.
-        :rtype: bool
-        """
-        seen_cutting_patterns = tuple([cutting_pattern['pattern'] for cutting_pattern in cut_patterns])
-
-        if cut_pattern['pattern'] not in seen_cutting_patterns:
-            return True
-
-        return False
-
-    @staticmethod
-    def __get_cut_pattern_id_by_pattern_in_cut_patterns(new_cutting_pattern, cutting_patterns):
-        """
-        Get the cutting pattern ID based on its pattern within a collection of cutting patterns.
-
-        :param new_cutting_pattern: The new cutting pattern to check.
-        :type new_cutting_pattern: dict
-
-        :param cutting_patterns: Collection of existing cutting patterns.
-        :type cutting_patterns: list
-
-        :return: ID of the cutting pattern if it already exists in the collection
-            , otherwise return the ID of the new pattern.
-        :rtype: str
-        """
-        seen_cutting_patterns = tuple([cutting_pattern['pattern'] for cutting_pattern in cutting_patterns])
-
-        if new_cutting_pattern['pattern'] not in seen_cutting_patterns:
-            return new_cutting_pattern['id']
-
-        return cutting_patterns[seen_cutting_patterns.index(new_cutting_pattern['pattern'])]['id']
+        return remaining_elements
 
     @staticmethod
     def __add_cut_pattern_to_genotype(frequency, cut_pattern, genotype):
@@ -152,61 +129,67 @@ class GeneticAlgorithm:
         Add the cutting pattern to the genotype and update frequencies.
 
         This static method updates the genotype by adding the given cutting pattern's frequency
-        to the existing frequency if the cutting pattern id already exists in the genotype.
-        If the id does not exist, it appends a new tuple representing the cutting pattern to the genotype.
+        to the existing frequency if the cutting pattern id already exists in the genotype,
+        otherwise the cutting pattern id is added with the given frequency.
 
         :param frequency: Frequency of the cutting pattern to be added.
         :type frequency: int
         :param cut_pattern: Cutting pattern to be added to the genotype.
         :type cut_pattern: dict
-        :param genotype: Genotype represented as a list of tuples, each containing frequency and cutting pattern id.
-        :type genotype: list
+        :param genotype: Genotype under construction, mapping cutting pattern id to its frequency.
+        :type genotype: dict
 
         :return: Updated genotype with the added cutting pattern.
-        :rtype: list
+        :rtype: dict
         """
-        # Check if the cutting pattern id already exists in the genotype
-        id_exists = any(existing_id == cut_pattern['id'] for _, existing_id in genotype)
-
-        if id_exists:
-            # If the id already exists, find its index and update the frequency
-            for i, (existing_frequency, existing_id) in enumerate(genotype):
-                if existing_id == cut_pattern['id']:
-                    genotype[i] = (existing_frequency + frequency, existing_id)
-                    break
-        else:
-            # If the id does not exist, append a new tuple representing the cutting pattern
-            genotype.append((frequency, cut_pattern['id']))
+        genotype[cut_pattern['id']] = genotype.get(cut_pattern['id'], 0) + frequency
 
         return genotype
 
-    def __is_feasible(self, cut_pattern):
+    def __index_cut_patterns(self):
         """
-        Check if a given cutting pattern is feasible within the specified beam length.
+        Rebuild the lookup indexes after best_cut_patterns or feasible_cut_patterns has been replaced.
 
-        Determines if the provided cutting pattern is executable by calculating the total length of the cut pieces
-        and checking if it is less than or equal to the length of the beam.
+        The ID index follows the lookup order of the lists it replaces: the first pattern with a given ID in
+        best_cut_patterns, then in feasible_cut_patterns, wins. The pattern indexes keep the first feasible and the
+        first best cutting pattern for each pattern. Cached genotype wastes depend on the ID index, so they are
+        dropped as well.
+
+        :return: None
+        """
+        self.genotype_waste_cache = {}
 
-        :param cut_pattern: A representation of a cutting pattern, either as a dictionary or a list.
-        :type cut_pattern: dict or list
+        self.cut_patterns_by_id = {}
+        for cut_pattern in chain(self.best_cut_patterns, self.feasible_cut_patterns):
+            self.cut_patterns_by_id.setdefault(cut_pattern['id'], cut_pattern)
 
-        :return: True if the cutting pattern is feasible; False otherwise.
-        :rtype: bool
+        self.feasible_cut_patterns_by_pattern = {}
+        for cut_pattern in self.feasible_cut_patterns:
+            self.feasible_cut_patterns_by_pattern.setdefault(cut_pattern['pattern'], cut_pattern)
+
+        self.best_cut_patterns_by_pattern = {}
+        for cut_pattern in self.best_cut_patterns:
+            self.best_cut_patterns_by_pattern.setdefault(cut_pattern['pattern'], cut_pattern)
+
+    def __add_feasible_cut_pattern(self, cut_pattern):
         """
-        if isinstance(cut_pattern, dict):
-            cut_pattern = cut_pattern['pattern']
+        Append a cutting pattern to feasible_cut_patterns and register it in the lookup indexes.
 
-        total_length = sum(
-            length * frequency for length, frequency in zip(self.unique_element_lengths, cut_pattern))
+        :param cut_pattern: Cutting pattern to add.
+        :type cut_pattern: dict
 
-        return total_length <= self.beam_length
+        :return: None
+        """
+        self.feasible_cut_patterns.append(cut_pattern)
+        self.cut_patterns_by_id.setdefault(cut_pattern['id'], cut_pattern)
+        self.feasible_cut_patterns_by_pattern.setdefault(cut_pattern['pattern'], cut_pattern)
 
     def __generate_cut_pattern(self, stock_size):
         """
         Generate a cutting pattern based on given stock size and constraints.
 
         The method generates a cutting pattern for a given stock size (beam length) considering the constraints:
-        - Randomly shuffles the unique element lengths to eliminate bias towards the first element.
+        - Randomly shuffles the order of unique elements to eliminate bias towards the first element.
         - Iterates through the shuffled lengths, determining a random frequency for each element.
         - Ensures that the generated cutting pattern is feasible by restricting the frequency based on available
           stock length and the count of each element.
@@ -214,37 +197,34 @@ class GeneticAlgorithm:
         :param stock_size: Length of the stock material (beam length) for which the cutting pattern is generated.
         :type stock_size: int
 
-        :return: Dictionary representing the generated cutting pattern with unique ID, stock size, pattern, and waste.
+        :return: Dictionary representing the generated cutting pattern with unique ID, stock size, pattern (tuple),
+            and waste.
         :rtype: dict
         """
-        cut_pattern = []
+        cut_pattern = [0] * len(self.unique_element_lengths)
         remaining_beam_length = self.beam_length
-        unique_elements_length = self.unique_element_lengths.copy()
+        element_indexes = list(range(len(self.unique_element_lengths)))
 
-        # Randomly shuffle the unique element lengths to eliminate bias
-        random.shuffle(unique_elements_length)
+        # Randomly shuffle the order of unique elements to eliminate bias
+        random.shuffle(element_indexes)
 
-        for i in range(len(unique_elements_length)):
-            # Generate a random frequency for each unique element within the constraints
-            frequency = random.randint(0,
-                                       min(self.unique_element_lengths_and_count_dict[unique_elements_length[i]],
-                                           remaining_beam_length // unique_elements_length[i]))
+        for i in element_indexes:
+            element_length = self.unique_element_lengths[i]
 
-            cut_pattern.append(frequency)
+            # Generate a random frequency for each unique element within the constraints
+            frequency = random.randrange(min(self.initial_remaining_elements[i],
+                                             remaining_beam_length // element_length) + 1)
 
-            remaining_beam_length -= cut_pattern[i] * unique_elements_length[i]
+            # Frequencies are stored at the element's own index, so the pattern stays ordered by unique element lengths
+            cut_pattern[i] = frequency
 
-        cut_pattern_id = GeneticAlgorithm.__generate_unique_id()
+            remaining_beam_length -= frequency * element_length
 
-        # Order the cutting pattern based on the unique element lengths
-        ordered_cut_pattern = []
-        for el in self.unique_element_lengths:
-            el_idx = unique_elements_length.index(el)
-            ordered_cut_pattern.append(cut_pattern[el_idx])
+        cut_pattern_id = self.__generate_unique_id()
 
         return {"id": cut_pattern_id,
                 "stock_size": stock_size,
-                "pattern": ordered_cut_pattern,
+                "pattern": tuple(cut_pattern),
                 "waste": remaining_beam_length}
 
     def __demand_driven_generate_cut_pattern(self, remaining_elements):
@@ -255,29 +235,31 @@ class GeneticAlgorithm:
         utilization of available stock.
         It calculates the frequency of each element based on demand and remaining stock length.
 
-        :param remaining_elements: Dictionary representing the remaining demand for each element.
-        :type remaining_elements: dict
+        :param remaining_elements: Remaining demand for each element, aligned with the unique element lengths.
+        :type remaining_elements: list
 
         :return: A cutting pattern generated based on demand.
         :rtype: dict
         """
-        # Sorting elements by demand in descending order
-        sorted_elements = dict(sorted(remaining_elements.items(), key=lambda x: x[1], reverse=True))
+        # Sorting element indexes by demand in descending order
+        sorted_element_indexes = sorted(range(len(remaining_elements)), key=remaining_elements.__getitem__,
+                                        reverse=True)
 
         cutting_pattern_id = self.__generate_unique_id()
         remaining_beam = self.beam_length
         cutting_pattern = [0 for _ in range(len(self.unique_element_lengths))]
 
-        for key, value in sorted_elements.items():
-            frequency = 0
-            if int(value) > 0:
-                frequency = min(remaining_beam // key, value)
-                remaining_beam -= frequency * key
-            cutting_pattern[self.unique_element_lengths.index(key)] = frequency
+        for idx in sorted_element_indexes:
+            value = remaining_elements[idx]
+            if value > 0:
+                element_length = self.unique_element_lengths[idx]
+                frequency = min(remaining_beam // element_length, value)
+                remaining_beam -= frequency * element_length
+                cutting_pattern[idx] = frequency
 
         return {"id": cutting_pattern_id,
                 "stock_size": self.beam_length,
-                "pattern": cutting_pattern,
+                "pattern": tuple(cutting_pattern),
                 "waste": remaining_beam}
 
     def __update_cut_pattern(self, cut_pattern, new_pattern):
@@ -286,7 +268,8 @@ class GeneticAlgorithm:
 
         The method takes an existing cutting pattern, replaces its pattern with a new one, and recalculates the waste.
         The waste is computed as the difference between the stock size (beam length) and the total length of the
-        new cutting pattern.
+        new cutting pattern. The updated cutting pattern gets a new ID, since the original one may still be used
+        (best_cut_patterns and feasible_cut_patterns share cutting patterns and are mutated separately).
 
         :param cut_pattern: Existing cutting pattern to be updated.
         :type cut_pattern: dict
@@ -297,15 +280,12 @@ class GeneticAlgorithm:
         :return: Updated cutting pattern with a new pattern and recalculated waste.
         :rtype: dict
         """
-        total_length = sum(
-            length * frequency for length, frequency in zip(self.unique_element_lengths, new_pattern))
-
-        waste = self.beam_length - total_length
+        waste = self.__calculate_cut_pattern_waste(new_pattern)
 
         return {
-            "id": cut_pattern["id"],
+            "id": self.__generate_unique_id(),
             "stock_size": cut_pattern["stock_size"],
-            "pattern": new_pattern,
+            "pattern": tuple(new_pattern),
             "waste": waste
         }
 
@@ -317,8 +297,8 @@ class GeneticAlgorithm:
             generated pattern is unique among feasible cutting patterns.
         If the pattern is not unique, it retrieves the ID of the existing cutting pattern with the same pattern.
 
-        :param remaining_elements: Dictionary representing the remaining demand for elements.
-        :type remaining_elements: dict
+        :param remaining_elements: Remaining demand for elements, aligned with the unique element lengths.
+        :type remaining_elements: list
 
         :return: A cutting pattern for remaining elements.
         :rtype: dict
@@ -327,18 +307,18 @@ class GeneticAlgorithm:
         cut_pattern = self.__demand_driven_generate_cut_pattern(remaining_elements)
 
         # Check for the uniqueness of the generated cutting pattern
-        if GeneticAlgorithm.__is_cut_pattern_unique_in_cut_patterns(cut_pattern, self.feasible_cut_patterns):
+        existing_cut_pattern = self.feasible_cut_patterns_by_pattern.get(cut_pattern['pattern'])
+        if existing_cut_pattern is None:
             # If unique, add it to the list of feasible cutting patterns
-            self.feasible_cut_patterns.append(cut_pattern)
+            self.__add_feasible_cut_pattern(cut_pattern)
         else:
             # If not unique, get the existing cutting pattern's ID
-            cut_pattern['id'] = (
-                GeneticAlgorithm.__get_cut_pattern_id_by_pattern_in_cut_patterns(cut_pattern,
-                                                                                 self.feasible_cut_patterns))
+            cut_pattern['id'] = existing_cut_pattern['id']
 
         return cut_pattern
 
-    def __add_cut_pattern_with_random_frequency_to_genotype(self, remaining_elements, cut_pattern):
+    def __add_cut_pattern_with_random_frequency_to_genotype(self, remaining_elements, remaining_elements_length,
+                                                            cut_pattern):
         """
         Add the given cutting pattern to the genotype and update relevant values.
 
@@ -347,8 +327,10 @@ class GeneticAlgorithm:
         It calculates the appropriate frequency to add the cutting pattern while considering constraints and returns the
             frequency used along with the updated remaining elements.
 
-        :param remaining_elements: Dictionary representing the remaining demand for elements.
-        :type remaining_elements: dict
+        :param remaining_elements: Remaining demand for elements, aligned with the unique element lengths.
+        :type remaining_elements: list
+        :param remaining_elements_length: Total length of the remaining elements.
+        :type remaining_elements_length: int
         :param cut_pattern: Cutting pattern to be added to the genotype.
         :type cut_pattern: dict
 
@@ -359,30 +341,17 @@ class GeneticAlgorithm:
         # Calculate the length obtained after using the cutting pattern
         cut_pattern_length = self.beam_length - cut_pattern['waste']
 
-        # Calculate the total length of remaining elements
-        remaining_elements_length = (
-            sum(element_length * frequency for element_length, frequency in remaining_elements.items()))
-
         # Check if the cutting pattern is sufficient to cover all remaining elements
         if remaining_elements_length == cut_pattern_length:
             frequency = 1
         else:
-            max_frequency = float('inf')
-
-            # Iterate through remaining elements and calculate the maximum feasible frequency
-            for key, value in remaining_elements.items():
-                element_count = cut_pattern['pattern'][self.unique_element_lengths.index(key)]
+            # Maximum feasible frequency: how many times the pattern fits into the remaining elements
+            max_frequency = min((value // element_count
+                                 for value, element_count in zip(remaining_elements, cut_pattern['pattern'])
+                                 if element_count != 0), default=None)
 
-                if element_count != 0:
-                    if value == element_count:
-                        max_frequency = 1
-                    else:
-                        frequency = value // element_count
-                        if frequency < max_frequency:
-                            max_frequency = frequency
-
-            # Handle cases where max_frequency is infinite or zero
-            if max_frequency == float('inf'):
+            # Handle cases where the pattern is empty or does not fit at all
+            if max_frequency is None:
                 frequency = 1
             else:
                 if max_frequency == 0:
@@ -403,7 +372,7 @@ class GeneticAlgorithm:
         """
         Retrieve a cutting pattern based on its unique identifier (ID).
 
-        Searches through both the best and feasible cutting pattern lists to find a pattern with the specified ID.
+        Looks the ID up in the index of the best and feasible cutting pattern lists (best patterns take precedence).
         If a matching pattern is found, it is returned; otherwise, a NoCuttingPatternException is raised.
 
         :param cut_pattern_id: The unique identifier (ID) of the cutting pattern to retrieve.
@@ -414,22 +383,17 @@ class GeneticAlgorithm:
 
         :raises NoCuttingPatternException: Raised when no cutting pattern is found with the provided ID.
         """
-        for cut_pattern in self.best_cut_patterns:
-            if cut_pattern_id == cut_pattern['id']:
-                return cut_pattern
-
-        for cut_pattern in self.feasible_cut_patterns:
-            if cut_pattern_id == cut_pattern['id']:
-                return cut_pattern
-
-        raise NoCuttingPatternException("No cutting pattern is available by the provided ID.")
+        try:
+            return self.cut_patterns_by_id[cut_pattern_id]
+        except KeyError:
+            raise NoCuttingPatternException("No cutting pattern is available by the provided ID.")
 
     def calculate_genotype_waste(self, genotype):
         """
         Calculate the total waste resulting from the cutting patterns represented by a given genotype.
 
         The waste is calculated by summing the product of the frequency of each cutting pattern and the waste
-        associated with that pattern.
+        associated with that pattern. Results are cached per genotype until the cutting patterns change.
 
         :param genotype: A representation of cutting patterns in the form of [(frequency, pattern_id), ...].
         :type genotype: list(tuple(int, str))
@@ -437,14 +401,33 @@ class GeneticAlgorithm:
         :return: The total waste resulting from the cutting patterns in the genotype.
         :rtype: float
         """
-        return sum([frequency * self.get_cut_pattern_by_id(pattern_id)['waste'] for frequency, pattern_id in genotype])
+        return self.__calculate_genotype_key_waste(tuple(genotype))
+
+    def __calculate_genotype_key_waste(self, genotype_key):
+        """
+        Calculate (or take from the cache) the total waste of a genotype given as a tuple.
+
+        :param genotype_key: Genotype in the form of ((frequency, pattern_id), ...).
+        :type genotype_key: tuple
+
+        :return: The total waste resulting from the cutting patterns in the genotype.
+        :rtype: float
+        """
+        genotype_waste = self.genotype_waste_cache.get(genotype_key)
+
+        if genotype_waste is None:
+            genotype_waste = sum([frequency * self.get_cut_pattern_by_id(pattern_id)['waste']
+                                  for frequency, pattern_id in genotype_key])
+            self.genotype_waste_cache[genotype_key] = genotype_waste
+
+        return genotype_waste
 
     def generate_population(self):
         """
         Generate a population of cutting patterns until reaching the desired population size.
 
-        This method uses the '__generate_cut_pattern' method to create cutting patterns and ensures that the population
-            adheres to feasibility constraints and uniqueness.
+        This method uses the '__generate_cut_pattern' method to create cutting patterns (feasible by construction)
+            and ensures that the population adheres to uniqueness.
         The maximum achievable size of a unique population within practical time frames is considered
             , and if the iterations exceed a threshold without finding a unique cutting pattern
             , the population size is adjusted accordingly.
@@ -463,15 +446,14 @@ class GeneticAlgorithm:
                 self.population_size = len(self.feasible_cut_patterns)
                 break
 
+            # Generated patterns never exceed the beam length, so only uniqueness has to be checked
             cutting_pattern_dict = self.__generate_cut_pattern(self.beam_length)
 
-            if (self.__is_feasible(cutting_pattern_dict) and
-                    GeneticAlgorithm.__is_cut_pattern_unique_in_cut_patterns(cutting_pattern_dict,
-                                                                             self.feasible_cut_patterns)):
+            if cutting_pattern_dict['pattern'] not in self.feasible_cut_patterns_by_pattern:
 
                 iter_without_unique_pattern = 0
 
-                self.feasible_cut_patterns.append(cutting_pattern_dict)
+                self.__add_feasible_cut_pattern(cutting_pattern_dict)
             else:
                 iter_without_unique_pattern += 1
 
@@ -489,24 +471,19 @@ class GeneticAlgorithm:
 
         :return: None
         """
-        # Sort feasible patterns by fitness in descending order
-        sorted_population = sorted(cut_patterns, key=lambda x: GeneticAlgorithm.calculate_fitness(x),
-                                   reverse=True)
+        # Sort feasible patterns by fitness in descending order (fitness decreases with waste)
+        sorted_population = sorted(cut_patterns, key=itemgetter('waste'))
 
         # Initialize variables
         best_patterns = []
         # Create a set of element lengths, ensuring unique elements
-        remaining_elements = set(self.element_lengths)
+        remaining_elements = set(self.unique_element_lengths)
 
         # Iterate through sorted patterns
         for pattern in sorted_population:
-            # Extract pattern elements
-            pattern_elements = set()
-            for length, frequency in zip(self.unique_element_lengths, pattern["pattern"]):
-                pattern_elements.update([length] * frequency)
-
-            # Check if the pattern covers any remaining elements
-            common_elements = pattern_elements.intersection(remaining_elements)
+            # Check if the pattern covers any remaining elements (only lengths cut at least once count)
+            common_elements = {length for length, frequency in zip(self.unique_element_lengths, pattern["pattern"])
+                               if frequency and length in remaining_elements}
 
             if common_elements:
                 # If the pattern covers remaining elements, add it to the best patterns
@@ -519,30 +496,40 @@ class GeneticAlgorithm:
                     break
 
         top_10_percent = int(0.1 * len(sorted_population))
+        seen_cutting_patterns = {cutting_pattern_dict['pattern'] for cutting_pattern_dict in best_patterns}
 
         # Include unique patterns in the top 10% of sorted population
         for cutting_pattern_dict in sorted_population:
-            if GeneticAlgorithm.__is_cut_pattern_unique_in_cut_patterns(cutting_pattern_dict, best_patterns):
+            if cutting_pattern_dict['pattern'] not in seen_cutting_patterns:
+                seen_cutting_patterns.add(cutting_pattern_dict['pattern'])
                 best_patterns.append(cutting_pattern_dict)
                 if len(best_patterns) >= top_10_percent:
                     break
 
         # Update the best patterns attribute
         self.best_cut_patterns = best_patterns
+        self.__index_cut_patterns()
 
-    def __calculate_cut_pattern_waste(self, pattern):
-        remaining_length = self.beam_length
-        for i in range(len(pattern)):
-            remaining_length -= pattern[i] * self.unique_element_lengths[i]
+    def __calculate_cut_pattern_length(self, pattern):
+        """
+        Calculate the total length of the elements described by a pattern.
 
-        return remaining_length
+        :param pattern: Element frequencies, aligned with the unique element lengths.
+        :type pattern: tuple or list
+
+        :return: Sum of element lengths multiplied by their frequencies.
+        :rtype: int
+        """
+        return sum(map(mul, self.unique_element_lengths, pattern))
+
+    def __calculate_cut_pattern_waste(self, pattern):
+        return self.beam_length - self.__calculate_cut_pattern_length(pattern)
 
     def __get_or_generate_cutting_pattern_by_pattern(self, pattern):
-        result_cut_pattern = None
-        for cut_pattern in self.feasible_cut_patterns + self.best_cut_patterns:
-            if cut_pattern.get('pattern') == pattern:
-                result_cut_pattern = cut_pattern
-                break
+        pattern = tuple(pattern)
+        result_cut_pattern = self.feasible_cut_patterns_by_pattern.get(pattern)
+        if result_cut_pattern is None:
+            result_cut_pattern = self.best_cut_patterns_by_pattern.get(pattern)
 
         if result_cut_pattern is None:
             result_cut_pattern = \
@@ -553,6 +540,8 @@ class GeneticAlgorithm:
                     'waste': self.__calculate_cut_pattern_waste(pattern)
                 }
             self.best_cut_patterns.append(result_cut_pattern)
+            self.cut_patterns_by_id.setdefault(result_cut_pattern['id'], result_cut_pattern)
+            self.best_cut_patterns_by_pattern[pattern] = result_cut_pattern
 
         return result_cut_pattern
 
@@ -583,15 +572,18 @@ class GeneticAlgorithm:
             # Choose the first cutting pattern
             first_cut_pattern_id = random.choice(self.best_cut_patterns)["id"]
 
-            # Initialize remaining elements dictionary and total length of all elements
-            remaining_elements = dict(Counter(self.element_lengths))
-            all_elements_length = sum(self.element_lengths)
+            # Initialize remaining elements (aligned with unique element lengths) and total length of all elements
+            remaining_elements = self.initial_remaining_elements.copy()
+            all_elements_length = self.all_elements_length
 
-            # Initialize genotype and iteration counter without adding a chromosome
-            genotype, iter_without_unique_cut_pattern = [], 0
+            # Initialize genotype ({cut_pattern_id: frequency} while it is built) and iteration counter
+            # without adding a chromosome
+            genotype, iter_without_unique_cut_pattern = {}, 0
 
             # Construct the genotype
-            while all_elements_length > 0 and sum(remaining_elements.values()) != 0:
+            # all_elements_length is kept equal to the total length of remaining_elements, so it reaches 0
+            # exactly when all elements have been cut
+            while all_elements_length > 0:
                 if i == 0:
                     # Logic for selecting the first cutting pattern
                     first_pattern = self.get_cut_pattern_by_id(first_cut_pattern_id)
@@ -600,7 +592,9 @@ class GeneticAlgorithm:
                     # Check if the first pattern is feasible
                     if 0 < first_pattern_length <= all_elements_length:
                         frequency, modified_remaining_elements = (
-                            self.__add_cut_pattern_with_random_frequency_to_genotype(remaining_elements, first_pattern))
+                            self.__add_cut_pattern_with_random_frequency_to_genotype(remaining_elements,
+                                                                                     all_elements_length,
+                                                                                     first_pattern))
 
                         if modified_remaining_elements:
                             remaining_elements = modified_remaining_elements
@@ -611,7 +605,7 @@ class GeneticAlgorithm:
                         first_cut_pattern_id = random.choice(self.best_cut_patterns)["id"]
                         continue
 
-                    genotype.append((frequency, first_cut_pattern_id))
+                    genotype[first_cut_pattern_id] = frequency
                     all_elements_length -= frequency * first_pattern_length
                     i += 1
 
@@ -622,6 +616,7 @@ class GeneticAlgorithm:
                         cutting_pattern = self.__generate_cut_pattern_for_remaining_elements(remaining_elements)
                         frequency, modified_remaining_elements = (
                             self.__add_cut_pattern_with_random_frequency_to_genotype(remaining_elements,
+                                                                                     all_elements_length,
                                                                                      cutting_pattern))
 
                         if modified_remaining_elements:
@@ -635,10 +630,10 @@ class GeneticAlgorithm:
 
                         continue
 
-                    random_cut_pattern_id = random.choice(self.feasible_cut_patterns)['id']
-
                     if iter_without_unique_cut_pattern > 2:
                         random_cut_pattern_id = random.choice(self.best_cut_patterns)["id"]
+                    else:
+                        random_cut_pattern_id = random.choice(self.feasible_cut_patterns)['id']
 
                     random_cut_pattern = self.get_cut_pattern_by_id(random_cut_pattern_id)
                     random_cut_pattern_length = self.beam_length - random_cut_pattern['waste']
@@ -647,6 +642,7 @@ class GeneticAlgorithm:
                     if 0 < random_cut_pattern_length <= all_elements_length:
                         frequency, modified_remaining_elements = (
                             self.__add_cut_pattern_with_random_frequency_to_genotype(remaining_elements,
+                                                                                     all_elements_length,
                                                                                      random_cut_pattern))
 
                         if modified_remaining_elements:
@@ -672,27 +668,44 @@ class GeneticAlgorithm:
 
                     i += 1
 
-            # Append the genotype to the solution population if not empty
+            # Append the genotype as a list of (frequency, cut_pattern_id) tuples if not empty
             if len(genotype) != 0:
-                solution_population_n.append(genotype)
+                solution_population_n.append([(frequency, cut_pattern_id)
+                                              for cut_pattern_id, frequency in genotype.items()])
 
         return solution_population_n
 
-    def __create_solution_waste_dict(self):
-        solution_waste_dict = {}
+    def __select_best_solution(self):
+        """
+        Find the solution with the lowest waste, preferring the one using the fewest cutting patterns.
+
+        A single pass over the solution population; on ties the first such solution wins.
 
-        for solution in self.solution_population:
-            solution_waste_dict[tuple(solution)] = self.calculate_genotype_waste(solution)
+        :return: The best solution as a list of (frequency, cutting pattern ID) tuples and its waste, or
+                 (None, None) if the solution population is empty.
+        :rtype: tuple
+        """
+        best_solution_key, best_waste = None, None
 
-        return solution_waste_dict
+        for solution_key in map(tuple, self.solution_population):
+            waste = self.__calculate_genotype_key_waste(solution_key)
+            if best_solution_key is None or (waste, len(solution_key)) < (best_waste, len(best_solution_key)):
+                best_solution_key, best_waste = solution_key, waste
+
+        if best_solution_key is None:
+            return None, None
+
+        return list(best_solution_key), best_waste
 
     def __select_elite_solution(self):
-        solution_waste_dict = self.__create_solution_waste_dict()
-        if solution_waste_dict is not None and bool(solution_waste_dict):
-            min_waste = min(solution_waste_dict.values())
-            elite_solution = min(
-                [list(solution) for solution, waste in solution_waste_dict.items() if waste == min_waste]
-                , key=lambda x: len(x))
+        elite_solution, elite_solution_waste = self.__select_best_solution()
+        if elite_solution is not None:
+            # Track improvement of the best solution for early stopping
+            if self.best_solution_waste is None or elite_solution_waste < self.best_solution_waste:
+                self.best_solution_waste = elite_solution_waste
+                self.generations_without_improvement = 0
+            else:
+                self.generations_without_improvement += 1
 
             genotype_pattern = []
 
@@ -731,7 +744,7 @@ class GeneticAlgorithm:
         if len(self.solution_population_2) != 0:
             self.solution_population_2 = []
 
-        self.solution_population_2 = self.__generate_solution_population_n(n=2).copy()
+        self.solution_population_2 = self.__generate_solution_population_n(n=2)
 
     def __combine_elite_solution(self):
         if self.elite_solution:
@@ -741,7 +754,7 @@ class GeneticAlgorithm:
                 elite_solution.append((frequency, cut_pattern['id']))
 
             self.elite_solution = []
-            self.solution_population.append(elite_solution.copy())
+            self.solution_population.append(elite_solution)
 
     def combine_solutions(self):
         """
@@ -763,44 +776,45 @@ class GeneticAlgorithm:
 
         This method iterates through the genotypes in the solution_population, extracting cutting patterns used to
         generate the genotypes.
-        It ensures that only unique cutting patterns are added to the solution_cut_patterns, preventing duplicates.
+        It ensures that only unique cutting patterns are added to the solution_cut_patterns, preventing duplicates
+        (also across generations).
         The resulting solution_cut_patterns represent the comprehensive set of unique cutting patterns employed
         in the generation of genotypes.
 
         :return: None
         """
-        seen_cutting_patterns = set()
         for genotype in self.solution_population:
             for i in range(len(genotype)):
                 cutting_pattern_id = genotype[i][1]
 
                 cutting_pattern = self.get_cut_pattern_by_id(cutting_pattern_id)
-                cutting_pattern_tuple = tuple(cutting_pattern["pattern"])
-                if cutting_pattern_tuple not in seen_cutting_patterns:
-                    seen_cutting_patterns.add(cutting_pattern_tuple)
+                cutting_pattern_tuple = cutting_pattern["pattern"]
+                if cutting_pattern_tuple not in self.solution_cut_patterns_seen:
+                    self.solution_cut_patterns_seen.add(cutting_pattern_tuple)
                     self.solution_cut_patterns.append(cutting_pattern)
 
-    def __create_child(self, pattern_part_1, pattern_part_2):
+    def __create_child(self, pattern_part_1, pattern_part_2, child_length):
         """
         Create a child cutting pattern based on two parent patterns.
 
         This function takes two parts of parent cutting patterns, combines them to create a new child cutting pattern,
-        and calculates the waste for the child.
+        and calculates the waste for the child from its already known length.
 
         :param pattern_part_1: First part of the cutting pattern.
-        :type pattern_part_1: list
+        :type pattern_part_1: tuple
         :param pattern_part_2: Second part of the cutting pattern.
-        :type pattern_part_2: list
+        :type pattern_part_2: tuple
+        :param child_length: Total length of the elements in the child cutting pattern.
+        :type child_length: int
 
         :return: A dictionary representing the child cutting pattern.
         :rtype: dict
         """
         child_pattern = pattern_part_1 + pattern_part_2
-        child_waste = self.beam_length - sum(
-            length * frequency for length, frequency in zip(self.unique_element_lengths, child_pattern))
+        child_waste = self.beam_length - child_length
 
         return {
-            "id": GeneticAlgorithm.__generate_unique_id(),
+            "id": self.__generate_unique_id(),
             "stock_size": self.beam_length,
             "pattern": child_pattern,
             "waste": child_waste
@@ -816,8 +830,6 @@ class GeneticAlgorithm:
 
         :return: None
         """
-        seen_pattern_tuples = set()
-
         for i in range(len(self.solution_cut_patterns)):
             # Select two parents for crossover
             parent_1 = self.best_cut_patterns[random.randrange(len(self.best_cut_patterns))]
@@ -827,28 +839,38 @@ class GeneticAlgorithm:
             b = len(parent_1["pattern"]) - 1
             if b == 0:
                 b = 1
-            crossover_point = random.randint(1, b)
+            crossover_point = random.randrange(1, b + 1)
 
             # Extract parent patterns
             parent_1_pattern = parent_1["pattern"]
             parent_2_pattern = parent_2["pattern"]
 
+            # Split the parents at the crossover point
+            parent_1_head, parent_1_tail = parent_1_pattern[:crossover_point], parent_1_pattern[crossover_point:]
+            parent_2_head, parent_2_tail = parent_2_pattern[:crossover_point], parent_2_pattern[crossover_point:]
+
+            # Each tail covers the rest of its parent's length, so only the heads have to be summed
+            parent_1_head_length = self.__calculate_cut_pattern_length(parent_1_head)
+            parent_2_head_length = self.__calculate_cut_pattern_length(parent_2_head)
+            parent_1_tail_length = self.beam_length - parent_1["waste"] - parent_1_head_length
+            parent_2_tail_length = self.beam_length - parent_2["waste"] - parent_2_head_length
+
             # Create two children patterns using crossover
-            child_1 = self.__create_child(parent_1_pattern[:crossover_point], parent_2_pattern[crossover_point:])
-            child_2 = self.__create_child(parent_2_pattern[:crossover_point], parent_1_pattern[crossover_point:])
+            child_1 = self.__create_child(parent_1_head, parent_2_tail, parent_1_head_length + parent_2_tail_length)
+            child_2 = self.__create_child(parent_2_head, parent_1_tail, parent_2_head_length + parent_1_tail_length)
 
-            # Check for duplicates based on pattern tuples
-            child_1_tuple = tuple(child_1["pattern"])
-            child_2_tuple = tuple(child_2["pattern"])
+            # Check for duplicates based on pattern tuples (patterns are stored as tuples)
+            child_1_tuple = child_1["pattern"]
+            child_2_tuple = child_2["pattern"]
 
             # Add child patterns to the crossed_cut_patterns list if they are not duplicates and have non-negative waste
-            if child_1_tuple not in seen_pattern_tuples:
-                seen_pattern_tuples.add(child_1_tuple)
+            if child_1_tuple not in self.crossed_cut_patterns_seen:
+                self.crossed_cut_patterns_seen.add(child_1_tuple)
                 if child_1["waste"] >= 0:
                     self.crossed_cut_patterns.append(child_1)
 
-            if child_2_tuple not in seen_pattern_tuples:
-                seen_pattern_tuples.add(child_2_tuple)
+            if child_2_tuple not in self.crossed_cut_patterns_seen:
+                self.crossed_cut_patterns_seen.add(child_2_tuple)
                 if child_2["waste"] >= 0:
                     self.crossed_cut_patterns.append(child_2)
 
@@ -856,47 +878,36 @@ class GeneticAlgorithm:
         """
         Select elite cutting patterns based on fitness.
 
-        Sorts the feasible_cut_patterns based on their fitness values and selects patterns with the best fitness.
+        Selects the feasible_cut_patterns with the best fitness, i.e. the lowest waste (fitness decreases with waste).
         The elite_cut_patterns list is updated with the selected patterns.
 
         :return: None
         """
-        # Sort feasible patterns by fitness in descending order
-        sorted_patterns = sorted(self.feasible_cut_patterns, key=lambda x: GeneticAlgorithm.calculate_fitness(x),
-                                 reverse=True)
-
-        # Get the best fitness value
-        best_fitness = GeneticAlgorithm.calculate_fitness(sorted_patterns[0])
+        # Get the best fitness value (the lowest waste)
+        min_waste = min(map(itemgetter('waste'), self.feasible_cut_patterns))
 
         # Select elite cutting patterns with the best fitness
         self.elite_cut_patterns.extend([
-            pattern for pattern in sorted_patterns if GeneticAlgorithm.calculate_fitness(pattern) == best_fitness
+            pattern for pattern in self.feasible_cut_patterns if pattern['waste'] == min_waste
         ])
 
     def update_cut_patterns(self):
         """
-        Update cutting patterns by combining elite patterns, crossed patterns, and selecting the best feasible patterns.
+        Update cutting patterns by selecting the best feasible patterns.
 
-        Combines elite patterns and crossed patterns, sorts feasible patterns, selects the top patterns based
-        on the specified percentage, and updates feasible_cut_patterns. Finally, it calculates the best cut patterns.
+        Sorts feasible patterns, selects the top patterns based on the specified percentage, and updates
+        feasible_cut_patterns. Finally, it calculates the best cut patterns.
 
         :return: None
         """
-        # Combine elite patterns and crossed patterns
-        combined_cut_patterns = self.crossed_cut_patterns.copy()
-        for elite_cut_pattern in self.elite_cut_patterns:
-            if GeneticAlgorithm.__is_cut_pattern_unique_in_cut_patterns(elite_cut_pattern, combined_cut_patterns):
-                combined_cut_patterns.append(elite_cut_pattern)
-
         # Sort cutting patterns by waste value
-        sorted_cut_patterns = sorted(self.feasible_cut_patterns, key=lambda x: x["waste"])
+        sorted_cut_patterns = sorted(self.feasible_cut_patterns, key=itemgetter('waste'))
 
         # Calculate the index from which to start selecting patterns (% of the best)
         selection_index = int(len(sorted_cut_patterns) * self.next_generation_feasible_patterns_percent)
 
         # Select the best feasible cutting patterns
-        selected_patterns = sorted_cut_patterns[:selection_index]
-        self.feasible_cut_patterns = selected_patterns.copy()
+        self.feasible_cut_patterns = sorted_cut_patterns[:selection_index]
 
         # Combine elite patterns and feasible patterns
         cutting_patterns = self.best_cut_patterns.copy()
@@ -921,31 +932,23 @@ class GeneticAlgorithm:
         mutated_cut_patterns = []
 
         for cut_pattern in cut_patterns:
-            mutated_pattern = cut_pattern['pattern'].copy()
+            mutated_pattern = list(cut_pattern['pattern'])
+            mutated_pattern_length = self.beam_length - cut_pattern['waste']
 
-            for i in range(len(mutated_pattern)):
+            for i, element_length in enumerate(self.unique_element_lengths):
                 # Check if mutation should occur for the current element
                 if random.random() < self.mutation_probability:
-                    # Increment the selected element until the pattern remains feasible
-                    original_element = mutated_pattern[i]
-
-                    # Check if the original element can be incremented
-                    if original_element < self.unique_element_lengths[i]:
-                        mutated_element = original_element + 1
-                        mutated_pattern[i] = mutated_element
-                        if not self.__is_feasible(mutated_pattern):
-                            mutated_pattern[i] = original_element
-                            continue
-
-                        while mutated_element <= self.unique_element_lengths[i] and not self.__is_feasible(
-                                mutated_pattern):
-                            mutated_pattern[i] = mutated_element
-                            mutated_element += 1
+                    # Increment the selected element if the original element can be incremented and the pattern
+                    # remains feasible (one more element adds exactly element_length to the pattern length)
+                    if (mutated_pattern[i] < element_length and
+                            mutated_pattern_length + element_length <= self.beam_length):
+                        mutated_pattern[i] += 1
+                        cut_pattern = self.__update_cut_pattern(cut_pattern, mutated_pattern)
                         break
 
-            mutated_cut_patterns.append(self.__update_cut_pattern(cut_pattern, mutated_pattern))
+            mutated_cut_patterns.append(cut_pattern)
 
-        return mutated_cut_patterns.copy()
+        return mutated_cut_patterns
 
     def choose_the_best(self):
         """
@@ -960,25 +963,20 @@ class GeneticAlgorithm:
         :rtype: tuple
         """
 
-        solution_waste_dict = self.__create_solution_waste_dict()
-        min_waste = min(solution_waste_dict.values())
-        best_solution = min(
-            [list(solution) for solution, waste in solution_waste_dict.items() if waste == min_waste]
-            , key=lambda x: len(x))
+        best_solution, _ = self.__select_best_solution()
 
         # Retrieve cutting patterns corresponding to the best result
         best_chromosomes = [self.get_cut_pattern_by_id(chromosome[1]) for chromosome in best_solution]
 
         return best_solution, best_chromosomes
 
-    def draw_cuttings(self, genotype, chromosomes, genotype_waste):
+    def draw_cuttings(self, genotype, chromosomes):
         """
         Visualize the cuttings based on the given genotype and cutting patterns.
 
         This method utilizes the draw_cuttings function to visualize the cuttings based on the provided genotype and
         cutting patterns.
 
-        :param genotype_waste:
         :param genotype: Genotype represented as a list of tuples, each containing frequency and cutting pattern ID.
         :type genotype: list
         :param chromosomes: List of cutting patterns corresponding to the genotype.
@@ -987,8 +985,46 @@ class GeneticAlgorithm:
         """
         return draw_cuttings_v2(genotype=genotype,
                                 chromosomes=chromosomes,
-                                unique_elements_length_dict=self.unique_element_lengths_and_count_dict,
-                                genotype_waste=genotype_waste)
+                                unique_elements_length_dict=self.unique_element_lengths_and_count_dict)
+
+    def __first_fit_decreasing_solution(self):
+        """
+        Build a solution with the First-Fit-Decreasing heuristic and keep it only if it is optimal.
+
+        Elements are placed from the longest to the shortest into the first beam with enough space left. The
+        solution is returned only if it uses the minimal number of beams, ceil(total length / beam length), since
+        then the genetic algorithm cannot find a solution with less waste.
+
+        :return: The solution as a list of (frequency, cutting pattern ID) tuples, or None if the heuristic did not
+                 reach the minimal number of beams.
+        :rtype: list or None
+        """
+        minimum_beam_count = -(-self.all_elements_length // self.beam_length)
+        beam_spaces = []
+        beam_patterns = []
+
+        for i in sorted(range(len(self.unique_element_lengths)), key=self.unique_element_lengths.__getitem__,
+                        reverse=True):
+            element_length = self.unique_element_lengths[i]
+            if element_length > self.beam_length:
+                return None
+
+            for _ in range(self.initial_remaining_elements[i]):
+                for beam_index, beam_space in enumerate(beam_spaces):
+                    if element_length <= beam_space:
+                        break
+                else:
+                    if len(beam_spaces) == minimum_beam_count:
+                        return None
+                    beam_index = len(beam_spaces)
+                    beam_spaces.append(self.beam_length)
+                    beam_patterns.append([0] * len(self.unique_element_lengths))
+
+                beam_spaces[beam_index] -= element_length
+                beam_patterns[beam_index][i] += 1
+
+        return [(frequency, self.__get_or_generate_cutting_pattern_by_pattern(pattern)['id'])
+                for pattern, frequency in Counter(map(tuple, beam_patterns)).items()]
 
     def run(self):
         """
@@ -996,6 +1032,7 @@ class GeneticAlgorithm:
 
         This method runs the genetic algorithm for the specified number of generations, following the defined steps:
 
+        (0) Return the First-Fit-Decreasing solution if it uses the minimal number of beams.
         (1) Generate the initial population of cutting patterns.
         (2-3) Calculate the best cutting patterns based on feasibility.
         (4-5) Generate solution populations for n=1 and n=2.
@@ -1006,12 +1043,22 @@ class GeneticAlgorithm:
         (10) Update the set of feasible cutting patterns.
         (11) Mutate the best and feasible cutting patterns.
 
-        The process is repeated for the specified number of generations, and the best solution is chosen based on waste
-        and the minimum number of unique cutting patterns used.
+        The process is repeated for the specified number of generations, or until the best solution reaches the lower
+        bound of the waste (all elements cut from the minimal number of beams) or has not improved for 'patience'
+        generations, and the best solution is chosen based on waste and the minimum number of unique
+        cutting patterns used.
 
         :return: A tuple containing the best solution and the cutting patterns for the best solution.
         :rtype: tuple
         """
+        # (0) The First-Fit-Decreasing solution, if it uses the minimal number of beams, cannot be improved
+        best_solution = self.__first_fit_decreasing_solution()
+        if best_solution is not None:
+            return (best_solution,
+                    [self.get_cut_pattern_by_id(pattern_id) for _, pattern_id in best_solution],
+                    self.calculate_genotype_waste(best_solution),
+                    self.unique_element_lengths_and_count_dict)
+
         self.generate_population()  # (1)
         self.calculate_best_cut_patterns(self.feasible_cut_patterns)  # (2-3)
 
@@ -1025,6 +1072,13 @@ class GeneticAlgorithm:
             self.update_cut_patterns()  # (10)
             self.best_cut_patterns = self.mutate(self.best_cut_patterns)  # (11)
             self.feasible_cut_patterns = self.mutate(self.feasible_cut_patterns)  # (11)
+            self.__index_cut_patterns()
+
+            # Early stopping when the best solution reached the lower bound of the waste or stopped improving
+            if self.best_solution_waste is not None and self.best_solution_waste <= self.minimum_waste:
+                break
+            if self.patience is not None and self.generations_without_improvement >= self.patience:
+                break
 
         # Additional iterations without mutation for choosing the best solution
         self.generate_solution_population_1()  # (4)
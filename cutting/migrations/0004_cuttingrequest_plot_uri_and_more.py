@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-15 10:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cutting", "0003_alter_cuttingpattern_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cuttingrequest",
+            name="plot_uri",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AddField(
+            model_name="cuttingrequest",
+            name="visualization_data",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AlterField(
+            model_name="cuttingrequest",
+            name="raw_length",
+            field=models.IntegerField(),
+        ),
+    ]
@@ -0,0 +1,36 @@
+import json
+
+from django.db import migrations
+
+
+def desired_lengths_to_json(apps, schema_editor):
+    CuttingRequest = apps.get_model("cutting", "CuttingRequest")
+    for cutting_request in CuttingRequest.objects.all():
+        if not cutting_request.desired_lengths.startswith("["):
+            # An empty string (all quantities were 0) becomes an empty list
+            csv_lengths = cutting_request.desired_lengths.strip()
+            cutting_request.desired_lengths = json.dumps(
+                list(map(int, csv_lengths.split(","))) if csv_lengths else []
+            )
+            cutting_request.save(update_fields=["desired_lengths"])
+
+
+def desired_lengths_to_csv(apps, schema_editor):
+    CuttingRequest = apps.get_model("cutting", "CuttingRequest")
+    for cutting_request in CuttingRequest.objects.all():
+        if cutting_request.desired_lengths.startswith("["):
+            # An empty list becomes an empty string, as the old views saved it
+            cutting_request.desired_lengths = ",".join(
+                map(str, json.loads(cutting_request.desired_lengths))
+            )
+            cutting_request.save(update_fields=["desired_lengths"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cutting", "0004_cuttingrequest_plot_uri_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(desired_lengths_to_json, desired_lengths_to_csv),
+    ]
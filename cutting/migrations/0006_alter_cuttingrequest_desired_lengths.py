@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cutting", "0005_desired_lengths_to_json"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="cuttingrequest",
+            name="desired_lengths",
+            field=models.JSONField(),
+        ),
+    ]
@@ -3,8 +3,11 @@ from django.db import models
 
 class CuttingRequest(models.Model):
     raw_length = models.IntegerField()
-    desired_lengths = models.TextField()  # Lista żądanych długości jako tekst
+    desired_lengths = models.JSONField()  # Lista żądanych długości
     created_at = models.DateTimeField(auto_now_add=True)
+    # Wyniki algorytmu zapisane przy pierwszym wyświetleniu (puste, dopóki nie zostały obliczone)
+    plot_uri = models.TextField(blank=True, default='')  # Wykres jako data URI (PNG w base64)
+    visualization_data = models.TextField(blank=True, default='')  # Dane wizualizacji jako JSON
 
 
 class CuttingPattern(models.Model):
@@ -1,34 +1,38 @@
-import matplotlib
-matplotlib.use('Agg')  # Wyłączenie trybu interaktywnego
-
-import matplotlib.pyplot as plt
 import matplotlib.cm as cm
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PatchCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
 import io
 import base64
+import logging
+
+logger = logging.getLogger(__name__)
 
 
-def draw_cuttings_v2(genotype, chromosomes, unique_elements_length_dict, genotype_waste):
+def draw_cuttings_v2(genotype, chromosomes, unique_elements_length_dict):
 
     unique_elements_length = [int(el) for el in unique_elements_length_dict.keys()]
-    all_elements_length = (
-        sum([int(element) * int(frequency) for element, frequency in unique_elements_length_dict.items()]))
-    beam_count = sum([el[0] for el in genotype])
     beam_length = chromosomes[0]['stock_size']
 
-    # Rysowanie wykresu
-    fig, ax = plt.subplots()
+    # Rysowanie wykresu bezpośrednio na płótnie Agg (bez pyplot i jego globalnego stanu)
+    fig = Figure(figsize=(10, 7))  # Możesz dostosować szerokość i wysokość według własnych potrzeb
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    # Prostokąty cięć i odpadów oraz ich kolory, rysowane na końcu jedną kolekcją
+    rectangles = []
+    colors = []
 
     # Iteracja po każdym zestawie danych
     for i, data in enumerate(chromosomes):
-        # Suma długości cięć
-        total_cut_length = sum([length * count for length, count in zip(unique_elements_length, data['pattern'])])
-
         # Dodawanie prostokątów reprezentujących cięcia
         left = 0
         for j, (cut_length, cut_count) in enumerate(zip(unique_elements_length, data['pattern'])):
+            color = cm.viridis(j / len(unique_elements_length))  # Wybieranie koloru z palety
             for _ in range(cut_count):  # Uwzględnianie ilości wystąpień elementu
-                color = cm.viridis(j / len(unique_elements_length))  # Wybieranie koloru z palety
-                ax.barh(y=i, width=cut_length, left=left, color=color, edgecolor='black', linewidth=0.5)
+                rectangles.append(Rectangle((left, i - 0.4), cut_length, 0.8))
+                colors.append(color)
 
                 # Dodawanie etykiety z długością elementu
                 ax.text(left + cut_length / 2, i + 0.2, str(cut_length), ha='center', va='center', color='black',
@@ -38,12 +42,15 @@ def draw_cuttings_v2(genotype, chromosomes, unique_elements_length_dict, genotyp
 
         # Dodanie prostokąta reprezentującego ilość odpadu, jeśli jest większa od zera
         if data['waste'] > 0:
-            ax.barh(y=i, width=data['waste'], left=left, color='white', edgecolor='black', linewidth=0.5)
+            rectangles.append(Rectangle((left, i - 0.4), data['waste'], 0.8))
+            colors.append('white')
 
             # Dodanie etykiety z ilością odpadu
             ax.text(left + data['waste'] / 2, i + 0.2, str(data['waste']), ha='center', va='center', color='black',
                     fontsize=8)
 
+    ax.add_collection(PatchCollection(rectangles, facecolors=colors, edgecolors='black', linewidths=0.5))
+
     # Ustawienie wysokości
     ax.set_ylim([-0.5, len(chromosomes) - 0.5])
     ax.set_yticks(range(len(chromosomes)))
@@ -51,16 +58,23 @@ def draw_cuttings_v2(genotype, chromosomes, unique_elements_length_dict, genotyp
 
     ax.set_xlim([0, beam_length])
 
-    # Zwiększenie rozmiaru okna wykresu
-    fig.set_size_inches(10, 7)  # Możesz dostosować szerokość i wysokość według własnych potrzeb
-
     # Convert plot to PNG image
     buf = io.BytesIO()
-    plt.savefig(buf, format='png')
+    fig.savefig(buf, format='png')
     buf.seek(0)
     string = base64.b64encode(buf.read())
     uri = 'data:image/png;base64,' + string.decode('utf-8')
     buf.close()
-    plt.close(fig)
 
     return uri
+
+
+def warm_up_draw_cuttings():
+    # Rysujemy mały wykres (import, cache czcionek, renderowanie Agg), aby pierwsze żądanie wizualizacji nie ponosiło
+    # tego kosztu; wywoływane tylko w procesie serwującym (wsgi/asgi), błąd nie blokuje startu aplikacji
+    try:
+        draw_cuttings_v2(genotype=[(1, 'warmup')],
+                         chromosomes=[{'id': 'warmup', 'stock_size': 2, 'pattern': (1,), 'waste': 1}],
+                         unique_elements_length_dict={1: 1})
+    except Exception:
+        logger.warning('Matplotlib warm-up failed', exc_info=True)
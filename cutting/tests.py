@@ -1,3 +1,279 @@
-from django.test import TestCase
+import json
+import random
+from collections import Counter
+from operator import mul
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from .forms import FileCuttingForm, ManualCuttingForm, MAX_PARTS_ROWS
+from .genetic_algorithm_v2 import GeneticAlgorithm
+from .models import CuttingPattern, CuttingPatternUsage, CuttingRequest
+from .views import save_cutting_pattern_and_generate_plot
+
+
+def manual_form_data(rows, raw_length='6000', total_forms=None):
+    data = {
+        'raw_length': raw_length,
+        'parts-TOTAL_FORMS': str(len(rows) if total_forms is None else total_forms),
+        'parts-INITIAL_FORMS': '0',
+    }
+    for i, (length, quantity) in enumerate(rows):
+        data[f'parts-{i}-length'] = length
+        data[f'parts-{i}-quantity'] = quantity
+    return data
+
+
+class ManualCuttingFormTests(SimpleTestCase):
+    def test_valid_rows(self):
+        form = ManualCuttingForm(manual_form_data([('1000', '2'), ('500', '3')]))
+
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data['parts_length'], [1000, 500])
+        self.assertEqual(form.cleaned_data['parts_quantity'], [2, 3])
+
+    def test_zero_rows(self):
+        form = ManualCuttingForm(manual_form_data([]))
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.non_field_errors(), ["Both parts_length and parts_quantity are required."])
+
+    def test_too_many_rows(self):
+        form = ManualCuttingForm(manual_form_data([('1000', '1')], total_forms=MAX_PARTS_ROWS + 1))
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.non_field_errors(), [f"At most {MAX_PARTS_ROWS} parts can be submitted."])
+
+    def test_partial_row(self):
+        form = ManualCuttingForm(manual_form_data([('1000', '2'), ('500', '')]))
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.non_field_errors(), ["All parts_length and parts_quantity must be valid integers."])
+
+    def test_empty_row_is_skipped(self):
+        form = ManualCuttingForm(manual_form_data([('1000', '2'), ('', '')]))
+
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data['parts_length'], [1000])
+        self.assertEqual(form.cleaned_data['parts_quantity'], [2])
+
+    def test_only_empty_rows(self):
+        form = ManualCuttingForm(manual_form_data([('', ''), ('', '')]))
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.non_field_errors(), ["Both parts_length and parts_quantity are required."])
+
+
+class FileCuttingFormTests(SimpleTestCase):
+    def file_form(self, content):
+        return FileCuttingForm({}, {'parts_file': SimpleUploadedFile('parts.txt', content)})
+
+    def test_valid_file(self):
+        form = self.file_form(b'6000\n1000 500\n500\n')
+
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data['parts_list'], [6000, 1000, 500, 500])
+
+    def test_invalid_byte(self):
+        form = self.file_form(b'6000 1000 5x0')
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.errors['parts_file'], ["Invalid number found: 5x0"])
+
+    def test_fewer_than_two_numbers(self):
+        form = self.file_form(b'6000\n')
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.errors['parts_file'], ["The file must contain at least two numbers."])
+
+    def test_oversized_number(self):
+        form = self.file_form(b'6000 ' + b'9' * 5000)
+
+        self.assertFalse(form.is_valid())
+        self.assertTrue(form.errors['parts_file'][0].startswith("Error processing file:"))
+
+
+class SaveCuttingPatternTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def assertUsagesCoverRequest(self, cutting_request):
+        # Pattern vectors are aligned with the unique lengths in their first-occurrence order
+        demand = Counter(cutting_request.desired_lengths)
+        produced = Counter()
+        for usage in cutting_request.pattern_usages.select_related('pattern'):
+            for length, count in zip(demand, json.loads(usage.pattern.pattern)):
+                produced[length] += count * usage.repetition
+        self.assertEqual(produced, demand)
+
+    def test_repeated_view_does_not_duplicate_usages(self):
+        cutting_request = CuttingRequest.objects.create(raw_length=1000, desired_lengths=[600, 400, 600, 400])
+        url = reverse('cutting_visualization', kwargs={'request_id': cutting_request.id})
+
+        self.assertEqual(self.client.get(url).status_code, 200)
+        usage_count = CuttingPatternUsage.objects.count()
+        cutting_request.refresh_from_db()
+        self.assertTrue(cutting_request.plot_uri)
+        self.assertTrue(cutting_request.visualization_data)
+
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+        self.assertEqual(CuttingPatternUsage.objects.count(), usage_count)
+        self.assertUsagesCoverRequest(cutting_request)
+
+    def test_repeated_request_reuses_patterns(self):
+        first = CuttingRequest.objects.create(raw_length=1000, desired_lengths=[600, 400, 600, 400])
+        second = CuttingRequest.objects.create(raw_length=1000, desired_lengths=[600, 400, 400, 600])
+
+        save_cutting_pattern_and_generate_plot(first)
+        pattern_count = CuttingPattern.objects.count()
+        save_cutting_pattern_and_generate_plot(second)
+
+        self.assertEqual(CuttingPattern.objects.count(), pattern_count)
+        self.assertEqual(first.pattern_usages.count(), second.pattern_usages.count())
+        self.assertUsagesCoverRequest(first)
+        self.assertUsagesCoverRequest(second)
+
+    def test_reordered_request_matches_its_own_lengths(self):
+        first = CuttingRequest.objects.create(raw_length=1000, desired_lengths=[700, 300, 300])
+        second = CuttingRequest.objects.create(raw_length=1000, desired_lengths=[300, 700, 300])
+
+        save_cutting_pattern_and_generate_plot(first)
+        save_cutting_pattern_and_generate_plot(second)
+
+        self.assertUsagesCoverRequest(first)
+        self.assertUsagesCoverRequest(second)
+
+
+class GeneticAlgorithmTests(SimpleTestCase):
+    beam_length = 6000
+    element_lengths = [1200] * 10 + [800] * 7 + [2500] * 4 + [450] * 13
+
+    def create_ga(self, seed, **kwargs):
+        random.seed(seed)
+        return GeneticAlgorithm(beam_length=self.beam_length, element_count=len(self.element_lengths),
+                                element_lengths=self.element_lengths, population_size=40,
+                                next_generation_feasible_patterns_percent=0.9, mutation_probability=0.9, **kwargs)
+
+    def assertCutPatternsConsistent(self, ga, cut_patterns):
+        for cut_pattern in cut_patterns:
+            pattern_length = sum(map(mul, ga.unique_element_lengths, cut_pattern['pattern']))
+            self.assertEqual(cut_pattern['waste'], ga.beam_length - pattern_length, cut_pattern)
+            self.assertGreaterEqual(cut_pattern['waste'], 0, cut_pattern)
+
+    def assertSolutionsConsistent(self, ga):
+        demand = Counter(ga.element_lengths)
+        for genotype in ga.solution_population:
+            produced = Counter()
+            beam_count = 0
+            for frequency, pattern_id in genotype:
+                pattern = ga.get_cut_pattern_by_id(pattern_id)['pattern']
+                for length, count in zip(ga.unique_element_lengths, pattern):
+                    produced[length] += frequency * count
+                beam_count += frequency
+            self.assertEqual(produced, demand, genotype)
+            self.assertEqual(ga.calculate_genotype_waste(genotype),
+                             beam_count * ga.beam_length - ga.all_elements_length, genotype)
+
+    def test_generations_keep_waste_and_demand_consistent(self):
+        for seed in range(3):
+            ga = self.create_ga(seed)
+            ga.generate_population()
+            ga.calculate_best_cut_patterns(ga.feasible_cut_patterns)
+
+            # The steps of GeneticAlgorithm.run(), checked after every generation
+            for _ in range(30):
+                ga.generate_solution_population_1()
+                ga.generate_solution_population_2()
+                ga.combine_solutions()
+                self.assertSolutionsConsistent(ga)
+
+                ga.extract_solution_patterns()
+                ga.crossover()
+                ga.select_elitism()
+                ga.update_cut_patterns()
+                ga.best_cut_patterns = ga.mutate(ga.best_cut_patterns)
+                ga.feasible_cut_patterns = ga.mutate(ga.feasible_cut_patterns)
+                ga._GeneticAlgorithm__index_cut_patterns()
+                self.assertCutPatternsConsistent(ga, ga.best_cut_patterns + ga.feasible_cut_patterns)
+
+    def test_crossover_children_waste_matches_their_pattern(self):
+        for seed in range(3):
+            ga = self.create_ga(seed)
+            ga.generate_population()
+            ga.calculate_best_cut_patterns(ga.feasible_cut_patterns)
+
+            for _ in range(15):
+                ga.generate_solution_population_1()
+                ga.generate_solution_population_2()
+                ga.combine_solutions()
+                ga.extract_solution_patterns()
+                ga.crossover()
+                # Child waste is derived from the parents' lengths, compare it with a full recomputation
+                self.assertCutPatternsConsistent(ga, ga.crossed_cut_patterns)
+
+                ga.select_elitism()
+                ga.update_cut_patterns()
+                ga.best_cut_patterns = ga.mutate(ga.best_cut_patterns)
+                ga.feasible_cut_patterns = ga.mutate(ga.feasible_cut_patterns)
+                ga._GeneticAlgorithm__index_cut_patterns()
+
+    @staticmethod
+    def count_generations(ga):
+        # mutate() is called twice per generation of the main loop in run()
+        mutate_calls = []
+        mutate = ga.mutate
+        ga.mutate = lambda cut_patterns: mutate_calls.append(cut_patterns) or mutate(cut_patterns)
+        return lambda: len(mutate_calls) // 2
+
+    def test_run_stops_at_lower_bound(self):
+        # First-Fit-Decreasing needs 3 beams here, the GA finds the 2-beam solution without waste
+        element_lengths = [5, 4, 4, 3, 2, 2]
+        random.seed(0)
+        ga = GeneticAlgorithm(beam_length=10, element_count=len(element_lengths), element_lengths=element_lengths,
+                              generation_count=200, patience=None)
+        generations = self.count_generations(ga)
+
+        _, _, genotype_waste, _ = ga.run()
+
+        self.assertEqual(ga.minimum_waste, 0)
+        self.assertEqual(ga.best_solution_waste, ga.minimum_waste)
+        self.assertEqual(genotype_waste, ga.minimum_waste)
+        self.assertLess(generations(), ga.generation_count - 1)
+
+    def test_run_stops_after_patience_generations_without_improvement(self):
+        # No two elements fit on one beam, so the lower bound of 3 beams cannot be reached
+        element_lengths = [6, 6, 6, 7]
+        random.seed(0)
+        ga = GeneticAlgorithm(beam_length=10, element_count=len(element_lengths), element_lengths=element_lengths,
+                              generation_count=200, patience=5)
+        generations = self.count_generations(ga)
+
+        _, _, genotype_waste, _ = ga.run()
+
+        self.assertGreater(genotype_waste, ga.minimum_waste)
+        # The best solution is found in the first generation, and the run stops on the 5th stalled generation
+        self.assertEqual(generations(), 1 + ga.patience)
+
+    def test_first_fit_decreasing_solution_at_lower_bound(self):
+        element_lengths = [600, 400, 500, 600, 400, 500]
+        ga = GeneticAlgorithm(beam_length=1000, element_count=len(element_lengths),
+                              element_lengths=element_lengths)
+
+        best_solution, cutting_patterns, genotype_waste, _ = ga.run()
+
+        self.assertEqual(genotype_waste, ga.minimum_waste)
+        self.assertEqual(sum(frequency for frequency, _ in best_solution), 3)
+        self.assertEqual([cut_pattern['id'] for cut_pattern in cutting_patterns],
+                         [pattern_id for _, pattern_id in best_solution])
+        # The solution is returned before the population is generated
+        self.assertEqual(ga.feasible_cut_patterns, [])
+
+    def test_first_fit_decreasing_above_lower_bound_runs_ga(self):
+        element_lengths = [5, 4, 4, 3, 2, 2]
+        ga = GeneticAlgorithm(beam_length=10, element_count=len(element_lengths),
+                              element_lengths=element_lengths)
+
+        self.assertIsNone(ga._GeneticAlgorithm__first_fit_decreasing_solution())
@@ -1,105 +1,148 @@
+import hashlib
 import json
-from django.http import JsonResponse
+import logging
+from collections import Counter
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
-from django.utils.safestring import mark_safe
 from . import genetic_algorithm_v2
 from .forms import FileCuttingForm, ManualCuttingForm
 from .models import CuttingRequest, CuttingPattern, CuttingPatternUsage
 
+logger = logging.getLogger(__name__)
 
-def save_cutting_pattern_and_generate_plot(request_id):
-    # Zapisujemy żądanie cięcia
-    cutting_request = get_object_or_404(CuttingRequest, id=request_id)
 
+# Czas przechowywania wyników algorytmu dla identycznych danych wejściowych (w sekundach)
+CUTTING_RESULT_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def get_cutting_result_cache_key(raw_length, element_lengths):
+    # Klucz zależy od długości surowca oraz unikalnych długości z ich liczbą, w kolejności pierwszego wystąpienia -
+    # wektory wzorców z zapisanego wyniku są indeksowane właśnie w tej kolejności
+    canonical_input = f"{raw_length}|{tuple(Counter(element_lengths).items())}"
+    return 'cutting-result:' + hashlib.blake2b(canonical_input.encode(), digest_size=16).hexdigest()
+
+
+def save_cutting_pattern_and_generate_plot(cutting_request):
     raw_length = cutting_request.raw_length
-    element_lengths = list(map(int, cutting_request.desired_lengths.split(',')))
-
-    ga_v2 = genetic_algorithm_v2.GeneticAlgorithm(
-        beam_length=raw_length,
-        element_count=len(element_lengths),
-        element_lengths=element_lengths,
-        population_size=70,
-        generation_count=70,
-        next_generation_feasible_patterns_percent=0.9,
-        mutation_probability=0.9
-    )
-
-    # Obliczamy wzorce cięcia przy użyciu algorytmu
-    best_solution, cutting_patterns_for_best_solution, genotype_waste, unique_element_lengths_and_count_dict = ga_v2.run()
-
-    # Generowanie wykresu przy użyciu draw_cuttings_v2
-    plot_uri = ga_v2.draw_cuttings(best_solution, cutting_patterns_for_best_solution, genotype_waste)
-
-    # Tworzenie i zapisywanie wzorców cięcia
-    pattern_dict = {}
-    for pattern_data in cutting_patterns_for_best_solution:
-        pattern_id = pattern_data['id']
-        pattern = CuttingPattern.objects.create(
-            id=pattern_id,  # Ustawienie id na wartość zwracaną przez algorytm
-            pattern=pattern_data['pattern'],
+    element_lengths = cutting_request.desired_lengths
+
+    cache_key = get_cutting_result_cache_key(raw_length, element_lengths)
+    cached_result = cache.get(cache_key)
+
+    if cached_result is not None:
+        # Te same dane wejściowe były już liczone - używamy zapisanego wyniku i wykresu
+        (best_solution, cutting_patterns_for_best_solution, genotype_waste, unique_element_lengths_and_count_dict,
+         plot_uri) = cached_result
+    else:
+        ga_v2 = genetic_algorithm_v2.GeneticAlgorithm(
+            beam_length=raw_length,
+            element_count=len(element_lengths),
+            element_lengths=element_lengths,
+            population_size=70,
+            generation_count=70,
+            next_generation_feasible_patterns_percent=0.9,
+            mutation_probability=0.9
+        )
+
+        # Obliczamy wzorce cięcia przy użyciu algorytmu
+        (best_solution, cutting_patterns_for_best_solution, genotype_waste,
+         unique_element_lengths_and_count_dict) = ga_v2.run()
+
+        # Generowanie wykresu przy użyciu draw_cuttings_v2
+        plot_uri = ga_v2.draw_cuttings(best_solution, cutting_patterns_for_best_solution)
+
+        cache.set(cache_key,
+                  (best_solution, cutting_patterns_for_best_solution, genotype_waste,
+                   unique_element_lengths_and_count_dict, plot_uri),
+                  timeout=CUTTING_RESULT_CACHE_TIMEOUT)
+
+    # Tworzenie wzorców cięcia (zapisywane razem z użyciami na końcu)
+    patterns = [
+        CuttingPattern(
+            id=pattern_data['id'],  # Ustawienie id na wartość zwracaną przez algorytm
+            pattern=list(pattern_data['pattern']),
             waste=pattern_data['waste']
         )
-        pattern_dict[pattern_id] = pattern
+        for pattern_data in cutting_patterns_for_best_solution
+    ]
 
     # Zapisywanie ilości powtórzeń każdego wzorca cięcia dla danego żądania
-    visualization_data = {}
-    for repetition, pattern_id in best_solution:
-        pattern = pattern_dict.get(pattern_id)
-        if pattern is not None:
-            CuttingPatternUsage.objects.create(
-                request=cutting_request,
-                pattern=pattern,
-                repetition=repetition
-            )
-        else:
-            print(f"Pattern id {pattern_id} not found in pattern_dict")
-
-        # Przygotowanie danych JSON dla szablonu
-        beam_count = sum([el[0] for el in best_solution])
-        all_elements_length = (
-            sum([int(element) * int(frequency) for element, frequency in
-                 unique_element_lengths_and_count_dict.items()]))
-        visualization_data = {
-            'genotype': best_solution,
-            'chromosomes': cutting_patterns_for_best_solution,
-            'genotype_waste': genotype_waste,
-            'raw_length': raw_length,
-            'desired_lengths': element_lengths,
-            'unique_element_lengths_and_count_dict': unique_element_lengths_and_count_dict,
-            'beam_count': beam_count,
-            'all_elements_length': all_elements_length,
-            'surowca_utilization': (100 * all_elements_length) / (beam_count * raw_length),
-        }
-
-    json_visualization_data = mark_safe(json.dumps(visualization_data))
-
-    return cutting_request.id, plot_uri, json_visualization_data
+    # (identyfikatory wzorców z best_solution zawsze należą do cutting_patterns_for_best_solution)
+    pattern_usages = [
+        CuttingPatternUsage(
+            request=cutting_request,
+            pattern_id=pattern_id,
+            repetition=repetition
+        )
+        for repetition, pattern_id in best_solution
+    ]
+
+    # Przygotowanie danych JSON dla szablonu (tylko wartości wyświetlane na stronie; wzorce i ich użycia są w bazie)
+    beam_count = sum([el[0] for el in best_solution])
+    all_elements_length = sum(element * frequency for element, frequency in
+                              unique_element_lengths_and_count_dict.items())
+    visualization_data = {
+        'genotype_waste': genotype_waste,
+        'raw_length': raw_length,
+        'unique_element_lengths_and_count_dict': unique_element_lengths_and_count_dict,
+        'beam_count': beam_count,
+        'all_elements_length': all_elements_length,
+        'surowca_utilization': (100 * all_elements_length) / (beam_count * raw_length),
+    }
 
+    # Zapisujemy wyniki, aby kolejne wyświetlenia nie uruchamiały algorytmu ponownie
+    cutting_request.plot_uri = plot_uri
+    cutting_request.visualization_data = json.dumps(visualization_data, separators=(',', ':'))
+
+    # Wzorce, użycia i wyniki zapisujemy w jednej transakcji (wzorce z zapisanego wyniku mogą już istnieć)
+    with transaction.atomic():
+        CuttingPattern.objects.bulk_create(patterns, ignore_conflicts=True)
+        CuttingPatternUsage.objects.bulk_create(pattern_usages)
+        cutting_request.save(update_fields=['plot_uri', 'visualization_data'])
+
+    return cutting_request.id, plot_uri, cutting_request.visualization_data
 
-def save_cutting_request(raw_length, desired_lengths):
-    desired_lengths = ','.join(map(str, desired_lengths))
 
+def save_cutting_request(raw_length, desired_lengths):
     cutting_request = CuttingRequest.objects.create(raw_length=raw_length, desired_lengths=desired_lengths)
 
     return cutting_request.id
 
 
 def cutting_visualization_view(request, request_id):
-    # Pobieramy żądanie cięcia z bazy danych
-    request_obj = CuttingRequest.objects.get(id=request_id)
+    # Pobieramy żądanie cięcia z bazy danych (jednym zapytaniem, przekazywane dalej)
+    request_obj = get_object_or_404(CuttingRequest, id=request_id)
 
-    # Uruchamiamy algorytm i generujemy wykres
-    request_id, plot_uri, json_visualization_data = save_cutting_pattern_and_generate_plot(request_id)
+    if request_obj.plot_uri:
+        # Wyniki zostały już obliczone przy wcześniejszym wyświetleniu
+        plot_uri = request_obj.plot_uri
+    else:
+        # Uruchamiamy algorytm i generujemy wykres (tylko przy pierwszym wyświetleniu)
+        request_id, plot_uri, _ = save_cutting_pattern_and_generate_plot(request_obj)
 
-    # Renderujemy dane na front-end
+    # Dane wizualizacji front-end pobiera osobno z cutting_data_view
     context = {
-        'visualization_data': json_visualization_data,
+        'request_id': request_id,
         'plot_uri': plot_uri
     }
 
     return render(request, 'cutting_visualization.html', context)
 
 
+def cutting_data_view(request, request_id):
+    request_obj = get_object_or_404(CuttingRequest, id=request_id)
+
+    if request_obj.plot_uri:
+        json_visualization_data = request_obj.visualization_data
+    else:
+        _, _, json_visualization_data = save_cutting_pattern_and_generate_plot(request_obj)
+
+    # Zwracamy zapisany JSON bez ponownej serializacji
+    return HttpResponse(json_visualization_data, content_type='application/json')
+
+
 def cutting_form_view(request):
     manual_form = ManualCuttingForm()
     file_form = FileCuttingForm()
@@ -115,14 +158,16 @@ def cutting_form_manual_view(request):
             parts_quantity = form.cleaned_data['parts_quantity']
 
             # Tworzenie rozszerzonej listy długości
-            expanded_list = [length for length, quantity in zip(parts_length, parts_quantity) for _ in range(quantity)]
+            expanded_list = []
+            for length, quantity in zip(parts_length, parts_quantity):
+                expanded_list.extend([length] * quantity)
 
             # Przekazanie rozszerzonej listy do funkcji obsługującej logikę cięcia
             request_id = save_cutting_request(raw_length, expanded_list)
 
             return redirect('cutting_visualization', request_id=request_id)
         else:
-            print(form.errors)  # Wyświetlanie błędów formularza dla debugowania
+            logger.debug('Form errors: %s', form.errors)  # Błędy formularza dla debugowania
     return redirect('cutting_form')
 
 
@@ -140,5 +185,5 @@ def cutting_form_file_view(request):
 
             return redirect('cutting_visualization', request_id=request_id)
         else:
-            print(form.errors)  # Wyświetlanie błędów formularza dla debugowania
+            logger.debug('Form errors: %s', form.errors)  # Błędy formularza dla debugowania
     return redirect('cutting_form')